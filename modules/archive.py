@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Archive Module - Converts files inside ZIP/TAR archives without extracting
+Made with LOVE by FodiYes
+"""
+
+import io
+import os
+import logging
+import tarfile
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Iterator, Optional, Tuple, Union
+from .converter import FormatConverter
+
+ARCHIVE_FORMATS = {
+    'zip': {'ext': '.zip', 'name': 'ZIP Archive', 'mode': None},
+    'tar': {'ext': '.tar', 'name': 'TAR Archive', 'mode': 'w'},
+    'tar.gz': {'ext': '.tar.gz', 'name': 'TAR.GZ Archive', 'mode': 'w:gz'},
+    'tgz': {'ext': '.tgz', 'name': 'TAR.GZ Archive', 'mode': 'w:gz'},
+    'tar.bz2': {'ext': '.tar.bz2', 'name': 'TAR.BZ2 Archive', 'mode': 'w:bz2'},
+    'tar.xz': {'ext': '.tar.xz', 'name': 'TAR.XZ Archive', 'mode': 'w:xz'}
+}
+
+MemberInfo = Union[zipfile.ZipInfo, tarfile.TarInfo]
+
+def member_name(info: MemberInfo) -> str:
+    """Return the path of an archive member within its archive."""
+    return info.filename if isinstance(info, zipfile.ZipInfo) else info.name
+
+def _member_mtime(info: MemberInfo) -> float:
+    """Return the modification time of an archive member as a timestamp."""
+    if isinstance(info, zipfile.ZipInfo):
+        return time.mktime(info.date_time + (0, 0, -1))
+    return info.mtime
+
+def _member_mode(info: MemberInfo) -> Optional[int]:
+    """Return the Unix permission bits of an archive member, if recorded."""
+    if isinstance(info, zipfile.ZipInfo):
+        return (info.external_attr >> 16) & 0o7777 or None
+    return info.mode
+
+def get_archive_format(file_path: str) -> Optional[str]:
+    """
+    Determine archive format based on extension.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Archive format key or None if the file is not an archive
+    """
+    name = file_path.lower()
+    matches = [fmt for fmt, info in ARCHIVE_FORMATS.items() if name.endswith(info['ext'])]
+    return max(matches, key=len) if matches else None
+
+def validate_archive(file_path: str) -> bool:
+    """Check that the file exists and is a readable ZIP or TAR archive."""
+    try:
+        if not os.path.exists(file_path) or get_archive_format(file_path) is None:
+            return False
+        return zipfile.is_zipfile(file_path) or tarfile.is_tarfile(file_path)
+    except Exception:
+        return False
+
+def strip_archive_ext(file_path: str) -> str:
+    """Return the file name without its (possibly compound) archive extension."""
+    name = os.path.basename(file_path)
+    archive_format = get_archive_format(name)
+    if archive_format:
+        return name[:-len(ARCHIVE_FORMATS[archive_format]['ext'])]
+    return os.path.splitext(name)[0]
+
+class ArchiveReader:
+    """
+    Iterates over the file members of a ZIP or TAR archive in a single pass.
+
+    TAR archives are read as a stream, so compressed archives are only
+    decompressed once. Progress is measured in members for ZIP archives, whose
+    member list is known up front, and in bytes read for TAR archives.
+    """
+
+    def __init__(self, archive_path: str):
+        """Open archive for reading."""
+        self.archive_path = archive_path
+        self._file = open(archive_path, 'rb')
+        self._size = os.path.getsize(archive_path) or 1
+        self._done = 0
+        try:
+            if zipfile.is_zipfile(self._file):
+                self._zip = zipfile.ZipFile(self._file, 'r')
+                self._tar = None
+                self._members = [m for m in self._zip.infolist() if not m.is_dir()]
+            else:
+                self._file.seek(0)
+                self._zip = None
+                self._tar = tarfile.open(fileobj=self._file, mode='r|*')
+        except Exception:
+            self._file.close()
+            raise
+
+    @property
+    def progress(self) -> float:
+        """Fraction of the archive consumed so far, from 0 to 1."""
+        if self._zip is not None:
+            return self._done / (len(self._members) or 1)
+        return min(self._file.tell() / self._size, 1.0)
+
+    def __iter__(self) -> Iterator[Tuple[MemberInfo, bytes]]:
+        """Yield (member info, member content) pairs in archive order."""
+        if self._zip is not None:
+            for member in self._members:
+                data = self._zip.read(member)
+                self._done += 1
+                yield member, data
+        else:
+            for member in self._tar:
+                if not member.isfile():
+                    continue
+                with self._tar.extractfile(member) as f:
+                    yield member, f.read()
+
+    def close(self):
+        if self._zip is not None:
+            self._zip.close()
+        else:
+            self._tar.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class ArchiveWriter:
+    """Writes in-memory file contents as members of a ZIP or TAR archive."""
+
+    def __init__(self, archive_path: str, archive_format: str):
+        """Create archive for writing."""
+        self.archive_path = archive_path
+        mode = ARCHIVE_FORMATS[archive_format]['mode']
+        os.makedirs(os.path.dirname(archive_path), exist_ok=True)
+        if mode is None:
+            self._zip = zipfile.ZipFile(archive_path, 'w', compression=zipfile.ZIP_DEFLATED)
+            self._tar = None
+        else:
+            self._zip = None
+            self._tar = tarfile.open(archive_path, mode)
+        self._names = set()
+
+    def _unique_name(self, name: str) -> str:
+        """Return name, suffixed with a counter if it was already written."""
+        base_name, ext = os.path.splitext(name)
+        unique_name = name
+        counter = 1
+        while unique_name in self._names:
+            unique_name = f"{base_name}_{counter}{ext}"
+            counter += 1
+        self._names.add(unique_name)
+        return unique_name
+
+    def write(self, name: str, data: bytes, source: Optional[MemberInfo] = None) -> str:
+        """
+        Add a member with the given content.
+
+        Args:
+            name: Requested member name
+            data: Member content
+            source: Member of the input archive whose modification time and
+                permissions are carried over; the current time is used if omitted
+
+        Returns:
+            Name the member was written under, made unique within the archive
+        """
+        name = self._unique_name(name)
+        mtime = _member_mtime(source) if source is not None else time.time()
+        mode = _member_mode(source) if source is not None else None
+        if self._zip is not None:
+            date_time = max(time.localtime(mtime)[:6], (1980, 1, 1, 0, 0, 0))
+            info = zipfile.ZipInfo(name, date_time=date_time)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = ((mode or 0o600) | 0o100000) << 16
+            self._zip.writestr(info, data)
+        else:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = mtime
+            if mode is not None:
+                info.mode = mode
+            self._tar.addfile(info, io.BytesIO(data))
+        return name
+
+    def close(self):
+        if self._zip is not None:
+            self._zip.close()
+        else:
+            self._tar.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+_worker_converter = None
+
+def _init_worker():
+    """Create the converter used by a conversion worker process."""
+    global _worker_converter
+    _worker_converter = FormatConverter()
+
+def _convert_member(name: str, data: bytes, input_format: str, output_format: str,
+                    settings: Dict[str, Any]) -> Tuple[str, bytes]:
+    """Convert a single archive member in a worker process, returning its output name and content."""
+    converted_content = _worker_converter.convert_stream(io.BytesIO(data), input_format,
+                                                         output_format, settings)
+    if not converted_content:
+        raise Exception(f"Error converting archive member: {name}")
+
+    content = _worker_converter.to_bytes(converted_content, output_format)
+    if content is None:
+        raise Exception(f"Error serializing archive member: {name}")
+
+    return f"{os.path.splitext(name)[0]}.{output_format}", content
+
+class ArchiveConverter:
+    """
+    Converts every supported member of an input archive into an output archive.
+
+    Members are read sequentially from the input archive, converted in parallel
+    by a process pool, and written to the output archive in their original order.
+    Processes are used instead of threads because text conversion is mostly
+    pure Python and would be serialized by the GIL. Members that cannot be
+    converted are copied into the output unchanged without being sent to a
+    worker process.
+    """
+
+    def __init__(self, archive_path: str, output_format: str, settings: Dict[str, Any],
+                 output_path: str, archive_format: str, max_workers: Optional[int] = None):
+        self.archive_path = archive_path
+        self.output_format = output_format
+        self.settings = settings
+        self.output_path = output_path
+        self.archive_format = archive_format
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.converter = FormatConverter()
+        self.logger = logging.getLogger(__name__)
+        self.converted = 0
+        self.copied = 0
+        self.errors = []
+
+    def run(self) -> Iterator[float]:
+        """
+        Convert archive members, yielding progress in percent after each member.
+
+        Members that cannot be converted are copied unchanged and counted in
+        ``copied``. Members whose conversion fails are copied unchanged as well,
+        and are logged and recorded in ``errors``. The output archive is written
+        to a temporary file and only moved to ``output_path`` once the whole
+        input archive has been read, so a failed run leaves no partial output.
+        """
+        temp_path = f"{self.output_path}.part"
+        finished = False
+        try:
+            with ArchiveReader(self.archive_path) as reader, \
+                    ArchiveWriter(temp_path, self.archive_format) as writer, \
+                    ProcessPoolExecutor(max_workers=self.max_workers,
+                                        initializer=_init_worker) as executor:
+                pending = deque()
+
+                def collect() -> float:
+                    info, data, future, progress = pending.popleft()
+                    name = member_name(info)
+                    try:
+                        result = future.result() if future is not None else None
+                        if result is not None:
+                            writer.write(*result)
+                            self.converted += 1
+                        else:
+                            self.logger.info(f"Copying archive member {name} unchanged")
+                            writer.write(name, data, info)
+                            self.copied += 1
+                    except Exception as e:
+                        self.logger.error(f"Error processing archive member {name}: {str(e)}")
+                        self.errors.append(f"{name}: {str(e)}")
+                        writer.write(name, data, info)
+                    return progress * 100
+
+                for info, data in reader:
+                    name = member_name(info)
+                    input_format = os.path.splitext(name)[1][1:].lower()
+                    future = None
+                    if self.converter.can_convert(input_format, self.output_format):
+                        future = executor.submit(_convert_member, name, data, input_format,
+                                                 self.output_format, self.settings)
+                    pending.append((info, data, future, reader.progress))
+                    if len(pending) >= self.max_workers * 4:
+                        yield collect()
+
+                while pending:
+                    yield collect()
+
+            os.replace(temp_path, self.output_path)
+            finished = True
+        finally:
+            if not finished and os.path.exists(temp_path):
+                os.remove(temp_path)
+
+        yield 100.0
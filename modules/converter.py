@@ -5,13 +5,14 @@ Format Converter Module - Handles file format conversions
 Made with LOVE by FodiYes
 """
 
+import io
 import os
 import json
 import logging
 import pandas as pd
 import xml.etree.ElementTree as ET
 from PIL import Image
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, BinaryIO, Union
 from .file_loader import FileType
 
 class FormatConverter:
@@ -69,13 +70,33 @@ class FormatConverter:
         Returns:
             Converted content or None if conversion failed
         """
-        try:
-            input_format = os.path.splitext(input_path)[1][1:].lower()
+        input_format = os.path.splitext(input_path)[1][1:].lower()
+        return self._convert(input_path, input_format, output_format, settings)
+
+    def convert_stream(self, stream: BinaryIO, input_format: str, output_format: str,
+                       settings: Dict[str, Any]) -> Any:
+        """
+        Convert content read from a binary stream to specified format.
+        
+        Args:
+            stream: Binary file-like object with the input content
+            input_format: Source format of the stream content
+            output_format: Target format
+            settings: Conversion settings
             
+        Returns:
+            Converted content or None if conversion failed
+        """
+        return self._convert(stream, input_format.lower(), output_format, settings)
+
+    def _convert(self, source: Union[str, BinaryIO], input_format: str, output_format: str,
+                 settings: Dict[str, Any]) -> Any:
+        """Dispatch conversion of a file path or binary stream by input format."""
+        try:
             if input_format in self.conversion_map[FileType.TEXT]:
-                return self._convert_text(input_path, input_format, output_format, settings)
+                return self._convert_text(source, input_format, output_format, settings)
             elif input_format in self.conversion_map[FileType.IMAGE]:
-                return self._convert_image(input_path, output_format)
+                return self._convert_image(source, output_format)
             
             return None
             
@@ -83,10 +104,10 @@ class FormatConverter:
             self.logger.error(f"Conversion error: {str(e)}")
             return None
 
-    def _convert_text(self, input_path: str, input_format: str, output_format: str, settings: Dict[str, Any]) -> Any:
+    def _convert_text(self, source: Union[str, BinaryIO], input_format: str, output_format: str, settings: Dict[str, Any]) -> Any:
         """Convert between text-based formats."""
         try:
-            data = self._load_text_data(input_path, input_format)
+            data = self._load_text_data(source, input_format)
             
             if data is None:
                 return None
@@ -97,20 +118,25 @@ class FormatConverter:
             self.logger.error(f"Text conversion error: {str(e)}")
             return None
     
-    def _load_text_data(self, input_path: str, input_format: str) -> Any:
+    def _load_text_data(self, source: Union[str, BinaryIO], input_format: str) -> Any:
         """Load data from text-based file formats."""
         if input_format == 'csv':
-            return pd.read_csv(input_path).to_dict('records')
+            return pd.read_csv(source).to_dict('records')
         elif input_format == 'json':
-            with open(input_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return json.loads(self._read_text(source))
         elif input_format == 'xml':
-            tree = ET.parse(input_path)
+            tree = ET.parse(source)
             return self._xml_to_dict(tree.getroot())
         elif input_format == 'txt':
-            with open(input_path, 'r', encoding='utf-8') as f:
-                return f.read()
+            return self._read_text(source)
         return None
+
+    def _read_text(self, source: Union[str, BinaryIO]) -> str:
+        """Read UTF-8 text from a file path or binary stream."""
+        if isinstance(source, str):
+            with open(source, 'r', encoding='utf-8') as f:
+                return f.read()
+        return source.read().decode('utf-8')
     
     def _save_text_data(self, data: Any, output_format: str, settings: Dict[str, Any]) -> str:
         """Convert data to specified text format."""
@@ -126,14 +152,15 @@ class FormatConverter:
             return str(data)
         return None
 
-    def _convert_image(self, input_path: str, output_format: str) -> Optional[Image.Image]:
+    def _convert_image(self, source: Union[str, BinaryIO], output_format: str) -> Optional[Image.Image]:
         """
         Convert image to specified format.
         
         Handles RGBA/LA images by converting them to RGB with white background.
         """
         try:
-            image = Image.open(input_path)
+            image = Image.open(source)
+            image.load()
             if image.mode in ('RGBA', 'LA'):
                 background = Image.new('RGB', image.size, (255, 255, 255))
                 background.paste(image, mask=image.split()[-1])
@@ -171,6 +198,31 @@ class FormatConverter:
             self.logger.error(f"Save error: {str(e)}")
             return False
 
+    def to_bytes(self, content: Any, output_format: str) -> Optional[bytes]:
+        """
+        Serialize converted content for writing into an archive.
+        
+        Args:
+            content: Converted file content
+            output_format: Target format of the content
+            
+        Returns:
+            Encoded content or None if serialization failed
+        """
+        try:
+            if isinstance(content, str):
+                return content.encode('utf-8')
+            elif isinstance(content, Image.Image):
+                buffer = io.BytesIO()
+                image_format = Image.registered_extensions().get(f".{output_format}")
+                content.save(buffer, format=image_format)
+                return buffer.getvalue()
+            return None
+            
+        except Exception as e:
+            self.logger.error(f"Serialization error: {str(e)}")
+            return None
+
     def _xml_to_dict(self, element: ET.Element) -> Dict:
         """Convert XML element to dictionary."""
         result = {}
@@ -7,6 +7,8 @@ from typing import List, Dict, Any
 import threading
 from .file_loader import FileLoader, FileType
 from .converter import FormatConverter
+from .archive import (ARCHIVE_FORMATS, ArchiveConverter, get_archive_format,
+                      strip_archive_ext, validate_archive)
 import logging
 
 class ConversionThread:
@@ -122,6 +124,14 @@ class MainWindow:
         self.json_indent.insert(0, '2')
         self.json_indent.pack(side='right')
 
+        archive_frame = ttk.Frame(settings_frame)
+        archive_frame.pack(fill='x', padx=5, pady=2)
+        ttk.Label(archive_frame, text='Archive output:').pack(side='left')
+        self.archive_format = ttk.Combobox(archive_frame, values=['zip', 'tar', 'tar.gz'],
+                                           state='readonly')
+        self.archive_format.set('zip')
+        self.archive_format.pack(side='right')
+
         output_frame = ttk.Frame(self.window)
         output_frame.pack(fill='x', padx=5, pady=5)
         
@@ -148,6 +158,7 @@ class MainWindow:
             extensions = [fmt['ext'] for fmt in formats.values()]
             type_desc = "Text files" if type_name == FileType.TEXT else "Images"
             filetypes.append((type_desc, ";".join("*" + ext for ext in extensions)))
+        filetypes.append(("Archives", ";".join("*" + fmt['ext'] for fmt in ARCHIVE_FORMATS.values())))
         
         files = filedialog.askopenfilenames(
             title="Select files",
@@ -157,7 +168,11 @@ class MainWindow:
         if files:
             valid_files = []
             for file_path in files:
-                if self.file_loader.validate_file(file_path):
+                if get_archive_format(file_path):
+                    is_valid = validate_archive(file_path)
+                else:
+                    is_valid = self.file_loader.validate_file(file_path)
+                if is_valid:
                     valid_files.append(file_path)
                 else:
                     messagebox.showwarning(
@@ -189,7 +204,8 @@ class MainWindow:
         return {
             'separator': self.csv_separator.get(),
             'xml_root': self.xml_root.get(),
-            'json_indent': self.json_indent.get()
+            'json_indent': self.json_indent.get(),
+            'archive_format': self.archive_format.get()
         }
 
     def start_conversion(self):
@@ -199,6 +215,8 @@ class MainWindow:
             settings = self.get_settings()
             
             for file_path in self.selected_files:
+                if get_archive_format(file_path):
+                    continue
                 input_format = os.path.splitext(file_path)[1][1:].lower()
                 if not self.converter.can_convert(input_format, output_format):
                     messagebox.showerror(
@@ -226,6 +244,11 @@ class MainWindow:
 
             for i, file_path in enumerate(self.selected_files, 1):
                 try:
+                    if get_archive_format(file_path):
+                        self.convert_archive(file_path, output_format, settings,
+                                             i - 1, total_files)
+                        continue
+
                     converted_content = self.converter.convert(
                         file_path,
                         output_format,
@@ -264,6 +287,40 @@ class MainWindow:
                            f"Error in conversion thread: {str(e)}")
             self.window.after(0, lambda: self.convert_button.config(state='normal'))
 
+    def convert_archive(self, archive_path: str, output_format: str, settings: Dict[str, Any],
+                        files_done: int, total_files: int):
+        archive_format = settings['archive_format']
+        base_name = strip_archive_ext(archive_path)
+        output_path = os.path.join(
+            self.output_dir,
+            f"{base_name}{ARCHIVE_FORMATS[archive_format]['ext']}"
+        )
+        if os.path.abspath(output_path) == os.path.abspath(archive_path):
+            output_path = os.path.join(
+                self.output_dir,
+                f"{base_name}_converted{ARCHIVE_FORMATS[archive_format]['ext']}"
+            )
+
+        archive_converter = ArchiveConverter(archive_path, output_format, settings,
+                                             output_path, archive_format)
+        last_percent = -1
+        for member_progress in archive_converter.run():
+            progress = (files_done + member_progress / 100) / total_files * 100
+            if int(progress) != last_percent:
+                last_percent = int(progress)
+                self.window.after(0, self.progress_var.set, progress)
+
+        if archive_converter.errors:
+            self.window.after(0, messagebox.showerror, "Error",
+                           f"{len(archive_converter.errors)} files in "
+                           f"{os.path.basename(archive_path)} failed to convert "
+                           f"and were copied unchanged")
+        if archive_converter.copied:
+            self.window.after(0, messagebox.showwarning, "Warning",
+                           f"{archive_converter.copied} files in "
+                           f"{os.path.basename(archive_path)} cannot be converted to "
+                           f"{output_format} and were copied unchanged")
+
     def conversion_finished(self):
         self.convert_button.config(state='normal')
         self.progress_var.set(0)